@@ -1,23 +1,54 @@
 from flask import Flask
+from flask.json.provider import JSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
+from marshmallow import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import HTTPException
 from config import config
+from decimal import Decimal
+import orjson
 import os
 
 # Initialize extensions
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'expire_on_commit': False})  # Keep loaded attributes after commit
 migrate = Migrate()
 cors = CORS()
 jwt = JWTManager()
 
+def _orjson_default(obj):
+    """Types orjson does not serialize natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for jsonify() and request parsing"""
+    options = orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default, option=self.options).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Encode straight to bytes instead of going through a str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_orjson_default, option=self.options),
+            mimetype='application/json'
+        )
+
 def create_app(config_name=None):
     if config_name is None:
         config_name = os.environ.get('FLASK_ENV', 'development')
     
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    app.json = OrjsonProvider(app)
     
     # Initialize extensions with app
     db.init_app(app)
@@ -25,18 +56,48 @@ def create_app(config_name=None):
     cors.init_app(app)
     jwt.init_app(app)
     
-    # JWT Configuration - Fix the subject string issue
+    # Optional Redis client for response caching
+    if app.config.get('REDIS_URL'):
+        import redis
+        app.extensions['redis'] = redis.Redis.from_url(app.config['REDIS_URL'])
+    
+    # JWT Configuration - identity is stored as an int under JWT_IDENTITY_CLAIM
     @jwt.user_identity_loader
     def user_identity_lookup(user):
-        """Convert user ID to string for JWT subject"""
-        return str(user)
+        """Keep the user ID numeric in the token"""
+        return int(user)
     
     @jwt.user_lookup_loader
     def user_lookup_callback(_jwt_header, jwt_data):
-        """Load user from JWT data"""
+        """Load user (with student profile) from JWT data for current_user"""
         from models import User
-        identity = jwt_data["sub"]
-        return User.query.filter_by(id=int(identity)).one_or_none()
+        from sqlalchemy.orm import joinedload, raiseload
+        identity = jwt_data[app.config['JWT_IDENTITY_CLAIM']]
+        options = [joinedload(User.student_profile)]
+        if app.config.get('RAISE_ON_LAZY_LOAD'):
+            # Surface N+1 regressions: any other relationship must be loaded explicitly
+            options.append(raiseload('*', sql_only=True))
+        return db.session.get(User, identity, options=options)
+    
+    # Error handlers - routes let these propagate instead of catching Exception
+    @app.errorhandler(ValidationError)
+    def handle_validation_error(e):
+        from schemas import first_error
+        return {'error': first_error(e)}, 400
+    
+    @app.errorhandler(SQLAlchemyError)
+    def handle_database_error(e):
+        db.session.rollback()
+        app.logger.exception('Database error')
+        return {'error': 'Database error'}, 500
+    
+    @app.errorhandler(Exception)
+    def handle_unexpected_error(e):
+        if isinstance(e, HTTPException):
+            return e
+        db.session.rollback()
+        app.logger.exception('Unhandled error')
+        return {'error': 'Internal server error'}, 500
     
     # Create upload directory
     upload_dir = app.config['UPLOAD_FOLDER']
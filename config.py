@@ -15,19 +15,30 @@ class Config:
     
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 20)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 40)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        'pool_recycle': 1800,
         'pool_pre_ping': True,
-        'pool_recycle': 300,
+        'isolation_level': 'READ COMMITTED',
     }
     
     # JWT Configuration
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-change-in-production'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    JWT_IDENTITY_CLAIM = 'uid'  # Numeric user id; 'sub' must be a string
     
     # Upload Configuration
     UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER') or 'uploads'
     MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))  # 16MB
     
+    # Cache Configuration (Redis caching is disabled when REDIS_URL is unset)
+    REDIS_URL = os.environ.get('REDIS_URL')
+    STUDENT_COUNT_CACHE_TTL = int(os.environ.get('STUDENT_COUNT_CACHE_TTL', 60))  # seconds
+    # Student lists count exactly below this many rows (planner estimates are unreliable there)
+    STUDENT_COUNT_ESTIMATE_MIN = int(os.environ.get('STUDENT_COUNT_ESTIMATE_MIN', 10000))
+    
     # CORS Configuration
     CORS_ORIGINS = ["*"]  # Configure this properly in production
 
@@ -37,8 +48,15 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     DEBUG = False
 
+class TestingConfig(Config):
+    # Selected with FLASK_ENV=testing; the endpoint tester runs against it (see README)
+    TESTING = True
+    # Lazy loads off the current user raise instead of issuing extra queries
+    RAISE_ON_LAZY_LOAD = True
+
 config = {
     'development': DevelopmentConfig,
     'production': ProductionConfig,
+    'testing': TestingConfig,
     'default': DevelopmentConfig
 }
\ No newline at end of file
@@ -72,13 +72,16 @@ class Student(db.Model):
     __tablename__ = 'students'
     
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     student_id = db.Column(db.String(20), unique=True, nullable=False)  # Format: FE22A111
     department = db.Column(db.Enum(Department), nullable=False)
     year_of_study = db.Column(db.Integer, nullable=False)  # 200, 300, 400, 500
     enrollment_year = db.Column(db.Integer, nullable=False)  # e.g., 2022
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Serves get_students filters; id last so filtered pages come back in id order
+    __table_args__ = (db.Index('ix_student_dept_year', 'department', 'year_of_study', 'id'),)
+    
     # Relationships
     user = db.relationship('User', backref=db.backref('student_profile', uselist=False))
     enrollments = db.relationship('Enrollment', backref='student', lazy=True)
@@ -173,6 +176,7 @@ class Session(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     attendance_open = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
     attendance_records = db.relationship('AttendanceRecord', backref='session', lazy=True, cascade='all, delete-orphan')
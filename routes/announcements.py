@@ -10,7 +10,7 @@ announcements_bp = Blueprint('announcements', __name__)
 def create_announcement():
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or user.role not in [UserRole.ADMIN, UserRole.LECTURER]:
             return jsonify({'error': 'Unauthorized'}), 403
@@ -37,7 +37,7 @@ def create_announcement():
                 return jsonify({'error': 'Course not found'}), 404
             
             # Check if lecturer owns the course
-            if user.role == UserRole.LECTURER and course.lecturer_id != int(current_user_id):  # Convert string back to int
+            if user.role == UserRole.LECTURER and course.lecturer_id != current_user_id:
                 return jsonify({'error': 'Unauthorized - not your course'}), 403
         
         # Only admins can create global announcements
@@ -47,7 +47,7 @@ def create_announcement():
         announcement = Announcement(
             title=data['title'],
             content=data['content'],
-            author_id=int(current_user_id),  # Convert string back to int
+            author_id=current_user_id,
             course_id=course_id,
             is_global=is_global,
             priority=data.get('priority', 'normal')
@@ -70,7 +70,7 @@ def create_announcement():
 def get_announcements():
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -99,13 +99,13 @@ def get_announcements():
             
         elif user.role == UserRole.LECTURER:
             # Lecturers see global announcements and announcements for their courses
-            taught_course_ids = [c.id for c in user.taught_courses]
+            taught_course_ids = [course_id for (course_id,) in db.session.query(Course.id).filter_by(lecturer_id=user.id)]
             
             query = Announcement.query.filter(
                 db.or_(
                     Announcement.is_global == True,
                     Announcement.course_id.in_(taught_course_ids),
-                    Announcement.author_id == int(current_user_id)  # Convert string back to int
+                    Announcement.author_id == current_user_id
                 ),
                 Announcement.is_active == True
             )
@@ -150,7 +150,7 @@ def get_announcements():
 def get_announcement(announcement_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -173,8 +173,8 @@ def get_announcement(announcement_id):
         elif user.role == UserRole.LECTURER:
             # Check if announcement is global, for their course, or created by them
             if not announcement.is_global:
-                taught_course_ids = [c.id for c in user.taught_courses]
-                if announcement.course_id not in taught_course_ids and announcement.author_id != int(current_user_id):  # Convert string back to int
+                taught_course_ids = [course_id for (course_id,) in db.session.query(Course.id).filter_by(lecturer_id=user.id)]
+                if announcement.course_id not in taught_course_ids and announcement.author_id != current_user_id:
                     return jsonify({'error': 'Unauthorized'}), 403
         
         return jsonify(announcement.to_dict()), 200
@@ -187,7 +187,7 @@ def get_announcement(announcement_id):
 def update_announcement(announcement_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or user.role not in [UserRole.ADMIN, UserRole.LECTURER]:
             return jsonify({'error': 'Unauthorized'}), 403
@@ -198,7 +198,7 @@ def update_announcement(announcement_id):
         
         # Check if user can edit this announcement
         if user.role == UserRole.LECTURER:
-            if announcement.author_id != int(current_user_id):  # Convert string back to int
+            if announcement.author_id != current_user_id:
                 return jsonify({'error': 'Can only edit your own announcements'}), 403
         
         data = request.get_json()
@@ -229,7 +229,7 @@ def update_announcement(announcement_id):
 def delete_announcement(announcement_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or user.role not in [UserRole.ADMIN, UserRole.LECTURER]:
             return jsonify({'error': 'Unauthorized'}), 403
@@ -240,7 +240,7 @@ def delete_announcement(announcement_id):
         
         # Check if user can delete this announcement
         if user.role == UserRole.LECTURER:
-            if announcement.author_id != int(current_user_id):  # Convert string back to int
+            if announcement.author_id != current_user_id:
                 return jsonify({'error': 'Can only delete your own announcements'}), 403
         
         # Soft delete by setting is_active to False
@@ -258,7 +258,7 @@ def delete_announcement(announcement_id):
 def get_course_announcements(course_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -283,7 +283,7 @@ def get_course_announcements(course_id):
                 
         elif user.role == UserRole.LECTURER:
             # Check if lecturer teaches this course
-            if course.lecturer_id != int(current_user_id):  # Convert string back to int
+            if course.lecturer_id != current_user_id:
                 return jsonify({'error': 'Unauthorized'}), 403
         
         # Get announcements for this course
@@ -1,6 +1,6 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from models import User, Session, AttendanceRecord, Student, Enrollment, UserRole, AttendanceStatus
+from models import User, Course, Session, AttendanceRecord, Student, Enrollment, UserRole, AttendanceStatus
 from app import db
 from datetime import datetime
 
@@ -87,7 +87,7 @@ def checkin():
 def get_session_attendance(session_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -119,7 +119,7 @@ def get_session_attendance(session_id):
             
         elif user.role == UserRole.LECTURER:
             # Check if lecturer owns the course
-            if session.course.lecturer_id != int(current_user_id):
+            if session.course.lecturer_id != current_user_id:
                 return jsonify({'error': 'Unauthorized'}), 403
             
             # Get all attendance records for this session
@@ -252,7 +252,6 @@ def get_course_attendance(course_id):
         if not user or user.role not in [UserRole.LECTURER, UserRole.ADMIN]:
             return jsonify({'error': 'Unauthorized'}), 403
         
-        from models import Course
         course = Course.query.get(course_id)
         if not course:
             return jsonify({'error': 'Course not found'}), 404
@@ -351,7 +350,7 @@ def mark_attendance():
             return jsonify({'error': 'Session not found'}), 404
         
         # Check if lecturer owns the course
-        if session.course.lecturer_id != int(current_user_id):
+        if session.course.lecturer_id != current_user_id:
             return jsonify({'error': 'Unauthorized'}), 403
         
         student = Student.query.get(data['student_id'])
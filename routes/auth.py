@@ -87,9 +87,9 @@ def register():
         
         db.session.commit()
         
-        # Create tokens - Convert user ID to string
-        access_token = create_access_token(identity=str(user.id))
-        refresh_token = create_refresh_token(identity=str(user.id))
+        # Create tokens
+        access_token = create_access_token(identity=user.id, additional_claims={'role': user.role.value})
+        refresh_token = create_refresh_token(identity=user.id)
         
         return jsonify({
             'message': 'User registered successfully',
@@ -118,9 +118,9 @@ def login():
         if not user.is_active:
             return jsonify({'error': 'Account is deactivated'}), 401
         
-        # Create tokens - Convert user ID to string
-        access_token = create_access_token(identity=str(user.id))
-        refresh_token = create_refresh_token(identity=str(user.id))
+        # Create tokens
+        access_token = create_access_token(identity=user.id, additional_claims={'role': user.role.value})
+        refresh_token = create_refresh_token(identity=user.id)
         
         # Get student profile if user is a student
         student_profile = None
@@ -143,12 +143,12 @@ def login():
 def refresh():
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or not user.is_active:
             return jsonify({'error': 'User not found or inactive'}), 404
         
-        access_token = create_access_token(identity=current_user_id)  # Keep as string
+        access_token = create_access_token(identity=current_user_id, additional_claims={'role': user.role.value})
         
         return jsonify({
             'access_token': access_token
@@ -162,7 +162,7 @@ def refresh():
 def get_current_user():
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -10,7 +10,7 @@ courses_bp = Blueprint('courses', __name__)
 def create_course():
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or user.role not in [UserRole.ADMIN, UserRole.LECTURER]:
             return jsonify({'error': 'Unauthorized'}), 403
@@ -41,7 +41,7 @@ def create_course():
             course_code=data['course_code'],
             course_name=data['course_name'],
             description=data.get('description'),
-            lecturer_id=int(current_user_id),  # Convert string back to int
+            lecturer_id=current_user_id,
             credits=data.get('credits', 3),
             semester=data.get('semester'),
             academic_year=data.get('academic_year'),
@@ -66,7 +66,7 @@ def create_course():
 def get_courses():
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -87,7 +87,7 @@ def get_courses():
             )
         elif user.role == UserRole.LECTURER:
             # Get courses taught by the lecturer
-            query = Course.query.filter_by(lecturer_id=int(current_user_id))  # Convert string back to int
+            query = Course.query.filter_by(lecturer_id=current_user_id)
         else:  # ADMIN
             # Get all courses
             query = Course.query
@@ -131,7 +131,7 @@ def get_courses():
 def get_course(course_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -152,7 +152,7 @@ def get_course(course_id):
                 return jsonify({'error': 'Not enrolled in this course'}), 403
         elif user.role == UserRole.LECTURER:
             # Check if lecturer teaches this course
-            if course.lecturer_id != int(current_user_id):  # Convert string back to int
+            if course.lecturer_id != current_user_id:
                 return jsonify({'error': 'Unauthorized'}), 403
         
         return jsonify(course.to_dict()), 200
@@ -165,7 +165,7 @@ def get_course(course_id):
 def update_course(course_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or user.role not in [UserRole.ADMIN, UserRole.LECTURER]:
             return jsonify({'error': 'Unauthorized'}), 403
@@ -175,7 +175,7 @@ def update_course(course_id):
             return jsonify({'error': 'Course not found'}), 404
         
         # Check if lecturer owns this course
-        if user.role == UserRole.LECTURER and course.lecturer_id != int(current_user_id):  # Convert string back to int
+        if user.role == UserRole.LECTURER and course.lecturer_id != current_user_id:
             return jsonify({'error': 'Unauthorized'}), 403
         
         data = request.get_json()
@@ -213,7 +213,7 @@ def update_course(course_id):
 def get_course_students(course_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or user.role not in [UserRole.ADMIN, UserRole.LECTURER]:
             return jsonify({'error': 'Unauthorized'}), 403
@@ -223,7 +223,7 @@ def get_course_students(course_id):
             return jsonify({'error': 'Course not found'}), 404
         
         # Check if lecturer owns this course
-        if user.role == UserRole.LECTURER and course.lecturer_id != int(current_user_id):  # Convert string back to int
+        if user.role == UserRole.LECTURER and course.lecturer_id != current_user_id:
             return jsonify({'error': 'Unauthorized'}), 403
         
         # Get enrolled students
@@ -252,7 +252,7 @@ def get_course_students(course_id):
 def enroll_student(course_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or user.role != UserRole.STUDENT:
             return jsonify({'error': 'Only students can enroll'}), 403
@@ -0,0 +1,29 @@
+from functools import wraps
+from flask import jsonify, g
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+from models import UserRole
+
+def require_role(*roles, error='Unauthorized'):
+    """Restrict a route to the given roles using the role claim in the JWT.
+
+    Sets g.user_id and g.role for the wrapped view so it does not need to
+    load the user just to check permissions.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        @jwt_required()
+        def wrapper(*args, **kwargs):
+            try:
+                role = UserRole(get_jwt().get('role'))
+            except ValueError:
+                # Tokens issued before the role claim existed
+                return jsonify({'error': error}), 403
+
+            if role not in roles:
+                return jsonify({'error': error}), 403
+
+            g.user_id = get_jwt_identity()
+            g.role = role
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
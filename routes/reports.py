@@ -18,7 +18,7 @@ reports_bp = Blueprint('reports', __name__)
 def export_course_attendance(course_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or user.role not in [UserRole.LECTURER, UserRole.ADMIN]:
             return jsonify({'error': 'Unauthorized'}), 403
@@ -28,7 +28,7 @@ def export_course_attendance(course_id):
             return jsonify({'error': 'Course not found'}), 404
         
         # Check if lecturer owns the course
-        if user.role == UserRole.LECTURER and course.lecturer_id != int(current_user_id):  # Convert string back to int
+        if user.role == UserRole.LECTURER and course.lecturer_id != current_user_id:
             return jsonify({'error': 'Unauthorized'}), 403
         
         # Get export format
@@ -257,7 +257,7 @@ def export_course_attendance(course_id):
 def export_student_attendance(student_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -466,7 +466,7 @@ def export_student_attendance(student_id):
 def get_attendance_summary():
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user or user.role not in [UserRole.LECTURER, UserRole.ADMIN]:
             return jsonify({'error': 'Unauthorized'}), 403
@@ -478,8 +478,8 @@ def get_attendance_summary():
         
         # Build base queries
         if user.role == UserRole.LECTURER:
-            courses_query = Course.query.filter_by(lecturer_id=int(current_user_id))  # Convert string back to int
-            sessions_query = Session.query.join(Course).filter(Course.lecturer_id == int(current_user_id))  # Convert string back to int
+            courses_query = Course.query.filter_by(lecturer_id=current_user_id)
+            sessions_query = Session.query.join(Course).filter(Course.lecturer_id == current_user_id)
         else:  # ADMIN
             courses_query = Course.query
             sessions_query = Session.query
@@ -1,21 +1,53 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, make_response, g
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from models import User, Course, Session, UserRole
+from models import User, Course, Session, Enrollment, UserRole
 from app import db
-from datetime import datetime, date, time
+from sqlalchemy import update, func
+from routes.decorators import require_role
+from datetime import date, time, datetime
+import hashlib
+import math
 
 sessions_bp = Blueprint('sessions', __name__)
 
+def parse_date(value):
+    """Parse YYYY-MM-DD with the fast ISO parser, still accepting unpadded input like 2024-1-5"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+
+def parse_time(value):
+    """Parse HH:MM with the fast ISO parser, still accepting unpadded input like 9:05 or 9:5"""
+    try:
+        return time.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, '%H:%M').time()
+
+def session_row_to_dict(row):
+    """Build a session list entry from a column row (see get_sessions)"""
+    return {
+        'id': row.id,
+        'course_id': row.course_id,
+        'session_name': row.session_name,
+        'session_date': row.session_date.isoformat(),
+        'start_time': row.start_time.strftime('%H:%M'),
+        'end_time': row.end_time.strftime('%H:%M'),
+        'location': row.location,
+        'is_active': row.is_active,
+        'attendance_open': row.attendance_open,
+        'created_at': row.created_at.isoformat(),
+        'course': {
+            'id': row.course_id,
+            'course_code': row.course_code,
+            'course_name': row.course_name
+        }
+    }
+
 @sessions_bp.route('', methods=['POST'])
-@jwt_required()
+@require_role(UserRole.LECTURER, error='Only lecturers can create sessions')
 def create_session():
     try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
-        
-        if not user or user.role != UserRole.LECTURER:
-            return jsonify({'error': 'Only lecturers can create sessions'}), 403
-        
         data = request.get_json()
         
         # Validate required fields
@@ -25,18 +57,20 @@ def create_session():
                 return jsonify({'error': f'{field} is required'}), 400
         
         # Check if course exists and lecturer owns it
-        course = Course.query.get(data['course_id'])
-        if not course:
+        lecturer_id = db.session.query(Course.lecturer_id).filter(
+            Course.id == data['course_id']
+        ).scalar()
+        if lecturer_id is None:
             return jsonify({'error': 'Course not found'}), 404
         
-        if course.lecturer_id != int(current_user_id):  # Convert string back to int
+        if lecturer_id != g.user_id:
             return jsonify({'error': 'Unauthorized - not your course'}), 403
         
         # Parse date and time
         try:
-            session_date = datetime.strptime(data['session_date'], '%Y-%m-%d').date()
-            start_time = datetime.strptime(data['start_time'], '%H:%M').time()
-            end_time = datetime.strptime(data['end_time'], '%H:%M').time()
+            session_date = parse_date(data['session_date'])
+            start_time = parse_time(data['start_time'])
+            end_time = parse_time(data['end_time'])
         except ValueError:
             return jsonify({'error': 'Invalid date/time format'}), 400
         
@@ -70,7 +104,7 @@ def create_session():
 def get_sessions():
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -85,7 +119,6 @@ def get_sessions():
         # Build query based on user role
         if user.role == UserRole.STUDENT:
             # Get sessions for courses the student is enrolled in
-            from models import Enrollment
             if user.student_profile:
                 query = Session.query.join(Course).join(Enrollment).filter(
                     Enrollment.student_id == user.student_profile.id,
@@ -103,10 +136,10 @@ def get_sessions():
         elif user.role == UserRole.LECTURER:
             # Get sessions for courses taught by the lecturer
             query = Session.query.join(Course).filter(
-                Course.lecturer_id == int(current_user_id)  # Convert string back to int
+                Course.lecturer_id == current_user_id
             )
         else:  # ADMIN
-            query = Session.query
+            query = Session.query.join(Course)
         
         # Apply filters
         if course_id:
@@ -114,33 +147,67 @@ def get_sessions():
         
         if date_from:
             try:
-                from_date = datetime.strptime(date_from, '%Y-%m-%d').date()
+                from_date = parse_date(date_from)
                 query = query.filter(Session.session_date >= from_date)
             except ValueError:
                 return jsonify({'error': 'Invalid date_from format'}), 400
         
         if date_to:
             try:
-                to_date = datetime.strptime(date_to, '%Y-%m-%d').date()
+                to_date = parse_date(date_to)
                 query = query.filter(Session.session_date <= to_date)
             except ValueError:
                 return jsonify({'error': 'Invalid date_to format'}), 400
         
+        # Fingerprint the filtered set so unchanged lists can be answered with 304
+        total, sessions_updated, courses_updated = query.with_entities(
+            func.count(Session.id),
+            func.max(Session.updated_at),
+            func.max(Course.updated_at)
+        ).one()
+        etag = hashlib.md5(
+            f"{user.id}:{request.query_string.decode()}:{total}:{sessions_updated}:{courses_updated}".encode(),
+            usedforsecurity=False  # Cache fingerprint only; keeps FIPS-mode OpenSSL builds working
+        ).hexdigest()
+        
+        if request.if_none_match.contains(etag):
+            response = make_response('', 304)
+            response.set_etag(etag)
+            return response
+        
         # Order by date and time
         query = query.order_by(Session.session_date.desc(), Session.start_time.desc())
         
-        # Paginate results
+        # Select only the columns the list needs instead of full ORM objects
+        query = query.with_entities(
+            Session.id,
+            Session.course_id,
+            Session.session_name,
+            Session.session_date,
+            Session.start_time,
+            Session.end_time,
+            Session.location,
+            Session.is_active,
+            Session.attendance_open,
+            Session.created_at,
+            Course.course_code,
+            Course.course_name
+        )
+        
+        # Paginate results, reusing the fingerprint's count instead of a second COUNT query
         sessions = query.paginate(
-            page=page, per_page=per_page, error_out=False
+            page=page, per_page=per_page, error_out=False, count=False
         )
         
-        return jsonify({
-            'sessions': [session.to_dict() for session in sessions.items],
-            'total': sessions.total,
-            'pages': sessions.pages,
+        response = jsonify({
+            'sessions': [session_row_to_dict(row) for row in sessions.items],
+            'total': total,
+            'pages': math.ceil(total / sessions.per_page),
             'current_page': page,
             'per_page': per_page
-        }), 200
+        })
+        response.set_etag(etag)
+        return response, 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -150,7 +217,7 @@ def get_sessions():
 def get_session(session_id):
     try:
         current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -162,20 +229,21 @@ def get_session(session_id):
         # Check access permissions
         if user.role == UserRole.STUDENT:
             # Check if student is enrolled in the course
-            from models import Enrollment
             if user.student_profile:
-                enrollment = Enrollment.query.filter_by(
-                    student_id=user.student_profile.id,
-                    course_id=session.course_id,
-                    is_active=True
-                ).first()
-                if not enrollment:
+                is_enrolled = db.session.query(
+                    Enrollment.query.filter_by(
+                        student_id=user.student_profile.id,
+                        course_id=session.course_id,
+                        is_active=True
+                    ).exists()
+                ).scalar()
+                if not is_enrolled:
                     return jsonify({'error': 'Not enrolled in this course'}), 403
             else:
                 return jsonify({'error': 'Student profile not found'}), 403
         elif user.role == UserRole.LECTURER:
             # Check if lecturer owns the course
-            if session.course.lecturer_id != int(current_user_id):  # Convert string back to int
+            if session.course.lecturer_id != current_user_id:
                 return jsonify({'error': 'Unauthorized'}), 403
         
         return jsonify(session.to_dict()), 200
@@ -183,34 +251,55 @@ def get_session(session_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def set_attendance_open(session_id, opening):
+    """Open or close attendance with a single owner-checked UPDATE.
+
+    Returns an error response if nothing was updated, otherwise None.
+    """
+    state_filter = Session.attendance_open.is_not(True) if opening else Session.attendance_open.is_(True)
+    result = db.session.execute(
+        update(Session)
+        .where(
+            Session.id == session_id,
+            Session.course_id == Course.id,
+            Course.lecturer_id == g.user_id,
+            state_filter
+        )
+        .values(attendance_open=opening)
+        .execution_options(synchronize_session=False)
+    )
+    
+    if result.rowcount:
+        return None
+    
+    # Nothing updated - work out why for the right error code
+    row = db.session.query(Session.attendance_open, Course.lecturer_id).join(Course).filter(
+        Session.id == session_id
+    ).first()
+    if not row:
+        return jsonify({'error': 'Session not found'}), 404
+    
+    if row.lecturer_id != g.user_id:
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    if opening:
+        return jsonify({'error': 'Session already started'}), 400
+    return jsonify({'error': 'Session not started yet'}), 400
+
 @sessions_bp.route('/<int:session_id>/start', methods=['POST'])
-@jwt_required()
+@require_role(UserRole.LECTURER, error='Only lecturers can start sessions')
 def start_session(session_id):
     try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
+        error = set_attendance_open(session_id, True)
+        if error:
+            db.session.rollback()
+            return error
         
-        if not user or user.role != UserRole.LECTURER:
-            return jsonify({'error': 'Only lecturers can start sessions'}), 403
-        
-        session = Session.query.get(session_id)
-        if not session:
-            return jsonify({'error': 'Session not found'}), 404
-        
-        # Check if lecturer owns the course
-        if session.course.lecturer_id != int(current_user_id):  # Convert string back to int
-            return jsonify({'error': 'Unauthorized'}), 403
-        
-        if session.attendance_open:
-            return jsonify({'error': 'Session already started'}), 400
-        
-        # Start the session
-        session.attendance_open = True
         db.session.commit()
         
         return jsonify({
             'message': 'Session started successfully',
-            'session': session.to_dict()
+            'session': Session.query.get(session_id).to_dict()
         }), 200
         
     except Exception as e:
@@ -218,33 +307,19 @@ def start_session(session_id):
         return jsonify({'error': str(e)}), 500
 
 @sessions_bp.route('/<int:session_id>/end', methods=['POST'])
-@jwt_required()
+@require_role(UserRole.LECTURER, error='Only lecturers can end sessions')
 def end_session(session_id):
     try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
-        
-        if not user or user.role != UserRole.LECTURER:
-            return jsonify({'error': 'Only lecturers can end sessions'}), 403
-        
-        session = Session.query.get(session_id)
-        if not session:
-            return jsonify({'error': 'Session not found'}), 404
-        
-        # Check if lecturer owns the course
-        if session.course.lecturer_id != int(current_user_id):  # Convert string back to int
-            return jsonify({'error': 'Unauthorized'}), 403
-        
-        if not session.attendance_open:
-            return jsonify({'error': 'Session not started yet'}), 400
+        error = set_attendance_open(session_id, False)
+        if error:
+            db.session.rollback()
+            return error
         
-        # End the session
-        session.attendance_open = False
         db.session.commit()
         
         return jsonify({
             'message': 'Session ended successfully',
-            'session': session.to_dict()
+            'session': Session.query.get(session_id).to_dict()
         }), 200
         
     except Exception as e:
@@ -252,21 +327,15 @@ def end_session(session_id):
         return jsonify({'error': str(e)}), 500
 
 @sessions_bp.route('/<int:session_id>', methods=['PUT'])
-@jwt_required()
+@require_role(UserRole.LECTURER, error='Only lecturers can update sessions')
 def update_session(session_id):
     try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
-        
-        if not user or user.role != UserRole.LECTURER:
-            return jsonify({'error': 'Only lecturers can update sessions'}), 403
-        
         session = Session.query.get(session_id)
         if not session:
             return jsonify({'error': 'Session not found'}), 404
         
         # Check if lecturer owns the course
-        if session.course.lecturer_id != int(current_user_id):  # Convert string back to int
+        if session.course.lecturer_id != g.user_id:
             return jsonify({'error': 'Unauthorized'}), 403
         
         data = request.get_json()
@@ -277,19 +346,19 @@ def update_session(session_id):
         
         if 'session_date' in data:
             try:
-                session.session_date = datetime.strptime(data['session_date'], '%Y-%m-%d').date()
+                session.session_date = parse_date(data['session_date'])
             except ValueError:
                 return jsonify({'error': 'Invalid date format'}), 400
         
         if 'start_time' in data:
             try:
-                session.start_time = datetime.strptime(data['start_time'], '%H:%M').time()
+                session.start_time = parse_time(data['start_time'])
             except ValueError:
                 return jsonify({'error': 'Invalid start_time format'}), 400
         
         if 'end_time' in data:
             try:
-                session.end_time = datetime.strptime(data['end_time'], '%H:%M').time()
+                session.end_time = parse_time(data['end_time'])
             except ValueError:
                 return jsonify({'error': 'Invalid end_time format'}), 400
         
@@ -312,21 +381,15 @@ def update_session(session_id):
         return jsonify({'error': str(e)}), 500
 
 @sessions_bp.route('/<int:session_id>', methods=['DELETE'])
-@jwt_required()
+@require_role(UserRole.LECTURER, error='Only lecturers can delete sessions')
 def delete_session(session_id):
     try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
-        
-        if not user or user.role != UserRole.LECTURER:
-            return jsonify({'error': 'Only lecturers can delete sessions'}), 403
-        
         session = Session.query.get(session_id)
         if not session:
             return jsonify({'error': 'Session not found'}), 404
         
         # Check if lecturer owns the course
-        if session.course.lecturer_id != int(current_user_id):  # Convert string back to int
+        if session.course.lecturer_id != g.user_id:
             return jsonify({'error': 'Unauthorized'}), 403
         
         db.session.delete(session)
@@ -1,8 +1,13 @@
-from flask import Blueprint, request, jsonify, current_app
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, request, jsonify, current_app, g, send_file
 from models import User, Course, Student, Enrollment, UserRole, Department
 from app import db
+from routes.decorators import require_role
+from sqlalchemy import text
+from werkzeug.security import generate_password_hash
+from datetime import datetime
 import pandas as pd
+import csv
+import io
 import os
 from werkzeug.utils import secure_filename
 import re
@@ -11,6 +16,10 @@ uploads_bp = Blueprint('uploads', __name__)
 
 ALLOWED_EXTENSIONS = {'xlsx', 'xls', 'csv'}
 
+# Default password for uploaded students (they should change it). Hashed once
+# at import instead of once per row, since hashing is deliberately slow.
+DEFAULT_PASSWORD_HASH = generate_password_hash('password123')
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
@@ -26,16 +35,75 @@ def parse_student_id(student_id):
         return 2000 + int(year_part)
     return None
 
+STAGING_COLUMNS = [
+    'email', 'password_hash', 'first_name', 'last_name', 'phone',
+    'student_id', 'department', 'year_of_study', 'enrollment_year'
+]
+
+# Enum type names are the ones SQLAlchemy created for User.role and Student.department
+BULK_CREATE_STUDENTS_SQL = text("""
+    WITH new_users AS (
+        INSERT INTO users (email, password_hash, first_name, last_name, role, phone,
+                           is_active, is_verified, created_at, updated_at)
+        SELECT email, password_hash, first_name, last_name, CAST('STUDENT' AS userrole), phone,
+               true, true, :now, :now
+        FROM student_upload_staging
+        ON CONFLICT (email) DO NOTHING
+        RETURNING id, email
+    ), new_students AS (
+        INSERT INTO students (user_id, student_id, department, year_of_study, enrollment_year, created_at)
+        SELECT new_users.id, staging.student_id, CAST(staging.department AS department),
+               staging.year_of_study, staging.enrollment_year, :now
+        FROM new_users
+        JOIN student_upload_staging AS staging ON staging.email = new_users.email
+        RETURNING id, student_id
+    ), new_enrollments AS (
+        INSERT INTO enrollments (student_id, course_id, enrolled_at, is_active)
+        SELECT id, :course_id, :now, true FROM new_students
+    )
+    SELECT student_id FROM new_students
+""")
+
+def bulk_create_students(rows, course_id):
+    """Create users, student profiles and enrollments for new students in bulk.
+
+    Rows are streamed into a temporary staging table with COPY and merged in
+    a single statement on the session's connection, so they commit or roll
+    back together with the rest of the upload. Returns the set of student IDs
+    that were created; rows whose email was registered concurrently are skipped.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(['\\N' if row[col] is None else row[col] for col in STAGING_COLUMNS])
+    buffer.seek(0)
+    
+    connection = db.session.connection()
+    connection.exec_driver_sql(
+        "CREATE TEMP TABLE student_upload_staging ("
+        "email VARCHAR(120), password_hash VARCHAR(255), first_name VARCHAR(50), "
+        "last_name VARCHAR(50), phone VARCHAR(20), student_id VARCHAR(20), "
+        "department VARCHAR(50), year_of_study INTEGER, enrollment_year INTEGER"
+        ") ON COMMIT DROP"
+    )
+    
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY student_upload_staging ({', '.join(STAGING_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer
+        )
+    
+    result = connection.execute(BULK_CREATE_STUDENTS_SQL, {
+        'course_id': course_id,
+        'now': datetime.utcnow()
+    })
+    return {row.student_id for row in result}
+
 @uploads_bp.route('/students', methods=['POST'])
-@jwt_required()
+@require_role(UserRole.LECTURER, error='Only lecturers can upload student lists')
 def upload_students():
     try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user or user.role != UserRole.LECTURER:
-            return jsonify({'error': 'Only lecturers can upload student lists'}), 403
-        
         # Check if file is present
         if 'file' not in request.files:
             return jsonify({'error': 'No file provided'}), 400
@@ -62,7 +130,7 @@ def upload_students():
         if not course:
             return jsonify({'error': 'Course not found'}), 404
         
-        if course.lecturer_id != current_user_id:
+        if course.lecturer_id != g.user_id:
             return jsonify({'error': 'Unauthorized - not your course'}), 403
         
         # Save file temporarily
@@ -100,13 +168,28 @@ def upload_students():
                 'enrolled_students': []
             }
             
-            for index, row in df.iterrows():
+            # Column positions for plain-tuple row access
+            col_index = {col: i for i, col in enumerate(df.columns)}
+            student_id_col = col_index['student_id']
+            first_name_col = col_index['first_name']
+            last_name_col = col_index['last_name']
+            email_col = col_index['email']
+            phone_col = col_index.get('phone')
+            department_col = col_index.get('department')
+            year_of_study_col = col_index.get('year_of_study')
+            
+            # Rows that need a brand new user, inserted in bulk after validation
+            new_students = []
+            pending_student_ids = set()
+            pending_emails = set()
+            
+            for row_number, row in enumerate(df.itertuples(index=False, name=None), start=1):
                 try:
                     # Validate student ID
-                    student_id = str(row['student_id']).strip()
+                    student_id = str(row[student_id_col]).strip()
                     if not validate_student_id(student_id):
                         results['errors'].append({
-                            'row': index + 1,
+                            'row': row_number,
                             'student_id': student_id,
                             'error': 'Invalid student ID format (should be FE22A111)'
                         })
@@ -117,10 +200,10 @@ def upload_students():
                     enrollment_year = parse_student_id(student_id)
                     
                     # Validate email
-                    email = str(row['email']).strip().lower()
+                    email = str(row[email_col]).strip().lower()
                     if not email or '@' not in email:
                         results['errors'].append({
-                            'row': index + 1,
+                            'row': row_number,
                             'student_id': student_id,
                             'error': 'Invalid email address'
                         })
@@ -129,9 +212,9 @@ def upload_students():
                     
                     # Get or determine department
                     department = None
-                    if 'department' in row and pd.notna(row['department']):
+                    if department_col is not None and pd.notna(row[department_col]):
                         try:
-                            department = Department(str(row['department']).strip().upper())
+                            department = Department(str(row[department_col]).strip().upper())
                         except ValueError:
                             # Use course department as fallback
                             department = course.department
@@ -140,9 +223,9 @@ def upload_students():
                     
                     # Get or determine year of study
                     year_of_study = None
-                    if 'year_of_study' in row and pd.notna(row['year_of_study']):
+                    if year_of_study_col is not None and pd.notna(row[year_of_study_col]):
                         try:
-                            year_of_study = int(row['year_of_study'])
+                            year_of_study = int(row[year_of_study_col])
                             if year_of_study not in [200, 300, 400, 500]:
                                 year_of_study = course.level
                         except (ValueError, TypeError):
@@ -170,7 +253,7 @@ def upload_students():
                                 })
                             else:
                                 results['errors'].append({
-                                    'row': index + 1,
+                                    'row': row_number,
                                     'student_id': student_id,
                                     'error': 'Already enrolled in this course'
                                 })
@@ -188,13 +271,23 @@ def upload_students():
                                 'action': 'enrolled_existing_student'
                             })
                     else:
+                        # Not in the database yet, but may be queued earlier in this file
+                        if student_id in pending_student_ids:
+                            results['errors'].append({
+                                'row': row_number,
+                                'student_id': student_id,
+                                'error': 'Duplicate student ID in file'
+                            })
+                            results['failed'] += 1
+                            continue
+                        
                         # Check if user with email exists
                         existing_user = User.query.filter_by(email=email).first()
                         
                         if existing_user:
                             if existing_user.role != UserRole.STUDENT:
                                 results['errors'].append({
-                                    'row': index + 1,
+                                    'row': row_number,
                                     'student_id': student_id,
                                     'error': 'Email belongs to non-student user'
                                 })
@@ -224,54 +317,59 @@ def upload_students():
                                 'action': 'created_profile_for_existing_user'
                             })
                         else:
-                            # Create new user and student
-                            new_user = User(
-                                email=email,
-                                first_name=str(row['first_name']).strip(),
-                                last_name=str(row['last_name']).strip(),
-                                role=UserRole.STUDENT,
-                                phone=str(row['phone']).strip() if 'phone' in row and pd.notna(row['phone']) else None,
-                                is_verified=True
-                            )
-                            # Set default password (student should change it)
-                            new_user.set_password('password123')
-                            
-                            db.session.add(new_user)
-                            db.session.flush()  # Get user ID
-                            
-                            # Create student profile
-                            student = Student(
-                                user_id=new_user.id,
-                                student_id=student_id,
-                                department=department,
-                                year_of_study=year_of_study,
-                                enrollment_year=enrollment_year
-                            )
-                            db.session.add(student)
-                            db.session.flush()  # Get student ID
-                            
-                            # Create enrollment
-                            enrollment = Enrollment(
-                                student_id=student.id,
-                                course_id=course_id
-                            )
-                            db.session.add(enrollment)
+                            # New users are collected and inserted in bulk after the loop
+                            if email in pending_emails:
+                                results['errors'].append({
+                                    'row': row_number,
+                                    'student_id': student_id,
+                                    'error': 'Duplicate email in file'
+                                })
+                                results['failed'] += 1
+                                continue
                             
-                            results['created_students'].append({
+                            pending_student_ids.add(student_id)
+                            pending_emails.add(email)
+                            new_students.append({
+                                'row': row_number,
+                                'email': email,
+                                'password_hash': DEFAULT_PASSWORD_HASH,
+                                'first_name': str(row[first_name_col]).strip(),
+                                'last_name': str(row[last_name_col]).strip(),
+                                'phone': str(row[phone_col]).strip() if phone_col is not None and pd.notna(row[phone_col]) else None,
                                 'student_id': student_id,
-                                'action': 'created_new_user_and_student'
+                                'department': department.name,
+                                'year_of_study': year_of_study,
+                                'enrollment_year': enrollment_year
                             })
+                            continue
                     
                     results['successful'] += 1
                     
                 except Exception as e:
                     results['errors'].append({
-                        'row': index + 1,
-                        'student_id': str(row.get('student_id', 'N/A')),
+                        'row': row_number,
+                        'student_id': str(row[student_id_col]),
                         'error': str(e)
                     })
                     results['failed'] += 1
             
+            if new_students:
+                created = bulk_create_students(new_students, course_id)
+                for new_student in new_students:
+                    if new_student['student_id'] in created:
+                        results['created_students'].append({
+                            'student_id': new_student['student_id'],
+                            'action': 'created_new_user_and_student'
+                        })
+                        results['successful'] += 1
+                    else:
+                        results['errors'].append({
+                            'row': new_student['row'],
+                            'student_id': new_student['student_id'],
+                            'error': 'Email already registered'
+                        })
+                        results['failed'] += 1
+            
             # Commit all changes
             db.session.commit()
             
@@ -294,15 +392,9 @@ def upload_students():
         return jsonify({'error': str(e)}), 500
 
 @uploads_bp.route('/students/template', methods=['GET'])
-@jwt_required()
+@require_role(UserRole.LECTURER, error='Only lecturers can download templates')
 def download_student_template():
     try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user or user.role != UserRole.LECTURER:
-            return jsonify({'error': 'Only lecturers can download templates'}), 403
-        
         # Create sample data
         sample_data = [
             {
@@ -381,7 +473,6 @@ def download_student_template():
         
         output.seek(0)
         
-        from flask import send_file
         return send_file(
             output,
             mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
@@ -1,153 +1,201 @@
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, current_user
 from models import User, Student, UserRole
 from app import db
+from sqlalchemy import select, func, text
+from schemas import DEPARTMENT_LOOKUP, change_password_schema, update_profile_schema
+import math
 
 users_bp = Blueprint('users', __name__)
 
+def student_row_to_dict(row):
+    """Same shape as Student.to_dict(), built from a get_students column row"""
+    return {
+        'id': row.id,
+        'user_id': row.user_id,
+        'student_id': row.student_id,
+        'department': row.department.value,
+        'year_of_study': row.year_of_study,
+        'enrollment_year': row.enrollment_year,
+        'user': {
+            'id': row.user_id,
+            'email': row.email,
+            'first_name': row.first_name,
+            'last_name': row.last_name,
+            'role': row.role.value,
+            'phone': row.phone,
+            'is_active': row.is_active,
+            'is_verified': row.is_verified,
+            'created_at': row.user_created_at.isoformat(),
+            'updated_at': row.user_updated_at.isoformat()
+        },
+        'created_at': row.created_at.isoformat()
+    }
+
+def build_profile(user):
+    profile_data = user.to_dict()
+    
+    # Add student profile if user is a student
+    if user.role == UserRole.STUDENT and user.student_profile:
+        profile_data['student_profile'] = user.student_profile.to_dict()
+    
+    return profile_data
+
+STUDENT_COUNT_CACHE_KEY = 'students:estimated_count'
+
+def estimated_student_count():
+    """Planner estimate of the students row count, cached in Redis when available.
+
+    Returns None when the caller should count exactly instead: the table has no
+    statistics yet, or the estimate is below STUDENT_COUNT_ESTIMATE_MIN.
+    """
+    cache = current_app.extensions.get('redis')
+    if cache is not None:
+        try:
+            cached = cache.get(STUDENT_COUNT_CACHE_KEY)
+            if cached is not None:
+                return int(cached)
+        except Exception as e:
+            current_app.logger.warning(f'Student count cache read failed: {e}')
+    
+    estimate = db.session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'students'::regclass")
+    ).scalar()
+    if estimate is None or estimate < current_app.config['STUDENT_COUNT_ESTIMATE_MIN']:
+        # Never analyzed (reltuples is -1, or 0 before PostgreSQL 14), or small
+        # enough that a stale estimate could be 0 while COUNT(*) is cheap anyway
+        return None
+    
+    if cache is not None:
+        try:
+            cache.setex(STUDENT_COUNT_CACHE_KEY, current_app.config['STUDENT_COUNT_CACHE_TTL'], estimate)
+        except Exception as e:
+            current_app.logger.warning(f'Student count cache write failed: {e}')
+    return estimate
+
 @users_bp.route('/profile', methods=['GET'])
 @jwt_required()
 def get_profile():
-    try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
-        
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
-        
-        profile_data = user.to_dict()
-        
-        # Add student profile if user is a student
-        if user.role == UserRole.STUDENT and user.student_profile:
-            profile_data['student_profile'] = user.student_profile.to_dict()
-        
-        return jsonify(profile_data), 200
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    # Loaded by the JWT user lookup with its student profile
+    return jsonify(build_profile(current_user)), 200
 
 @users_bp.route('/profile', methods=['PUT'])
 @jwt_required()
 def update_profile():
-    try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
-        
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
-        
-        data = request.get_json()
-        
-        # Update user fields
-        if 'first_name' in data:
-            user.first_name = data['first_name']
-        if 'last_name' in data:
-            user.last_name = data['last_name']
-        if 'phone' in data:
-            user.phone = data['phone']
-        
-        # Update student profile if user is a student
-        if user.role == UserRole.STUDENT and user.student_profile:
-            student_data = data.get('student_profile', {})
-            student = user.student_profile
-            
-            if 'department' in student_data:
-                try:
-                    from models import Department
-                    student.department = Department(student_data['department'].upper())
-                except ValueError:
-                    return jsonify({'error': 'Invalid department'}), 400
-            
-            if 'year_of_study' in student_data:
-                student.year_of_study = student_data['year_of_study']
-        
-        db.session.commit()
-        
-        profile_data = user.to_dict()
-        if user.role == UserRole.STUDENT and user.student_profile:
-            profile_data['student_profile'] = user.student_profile.to_dict()
-        
-        return jsonify({
-            'message': 'Profile updated successfully',
-            'profile': profile_data
-        }), 200
-        
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+    user = current_user
+    data = update_profile_schema.load(request.get_json() or {})
+    
+    # Update user fields
+    if 'first_name' in data:
+        user.first_name = data['first_name']
+    if 'last_name' in data:
+        user.last_name = data['last_name']
+    if 'phone' in data:
+        user.phone = data['phone']
+    
+    # Update student profile if user is a student
+    if user.role == UserRole.STUDENT and user.student_profile:
+        student_data = data['student_profile']
+        student = user.student_profile
+        
+        if 'department' in student_data:
+            student.department = student_data['department']
+        
+        if 'year_of_study' in student_data:
+            student.year_of_study = student_data['year_of_study']
+    
+    db.session.commit()
+    
+    # Attributes stay loaded after commit (expire_on_commit=False), so this
+    # serializes what was just written without reloading the user
+    return jsonify({
+        'message': 'Profile updated successfully',
+        'profile': build_profile(user)
+    }), 200
 
 @users_bp.route('/change-password', methods=['POST'])
 @jwt_required()
 def change_password():
-    try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
-        
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
-        
-        data = request.get_json()
-        
-        if not data.get('current_password') or not data.get('new_password'):
-            return jsonify({'error': 'Current password and new password are required'}), 400
-        
-        if not user.check_password(data['current_password']):
-            return jsonify({'error': 'Current password is incorrect'}), 400
-        
-        if len(data['new_password']) < 6:
-            return jsonify({'error': 'New password must be at least 6 characters long'}), 400
-        
-        user.set_password(data['new_password'])
-        db.session.commit()
-        
-        return jsonify({'message': 'Password changed successfully'}), 200
-        
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+    user = current_user
+    data = change_password_schema.load(request.get_json() or {})
+    
+    if not user.check_password(data['current_password']):
+        return jsonify({'error': 'Current password is incorrect'}), 400
+    
+    user.set_password(data['new_password'])
+    db.session.commit()
+    
+    return jsonify({'message': 'Password changed successfully'}), 200
 
 @users_bp.route('/students', methods=['GET'])
 @jwt_required()
 def get_students():
-    try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(int(current_user_id))  # Convert string back to int
-        
-        if not user or user.role not in [UserRole.ADMIN, UserRole.LECTURER]:
-            return jsonify({'error': 'Unauthorized'}), 403
-        
-        # Get query parameters
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
-        department = request.args.get('department')
-        year_of_study = request.args.get('year_of_study', type=int)
-        
-        # Build query
-        query = Student.query.join(User)
-        
-        if department:
-            from models import Department
-            try:
-                dept_enum = Department(department.upper())
-                query = query.filter(Student.department == dept_enum)
-            except ValueError:
-                return jsonify({'error': 'Invalid department'}), 400
-        
-        if year_of_study:
-            query = query.filter(Student.year_of_study == year_of_study)
-        
-        # Paginate results
-        students = query.paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-        
-        return jsonify({
-            'students': [student.to_dict() for student in students.items],
-            'total': students.total,
-            'pages': students.pages,
-            'current_page': page,
-            'per_page': per_page
-        }), 200
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    if current_user.role not in [UserRole.ADMIN, UserRole.LECTURER]:
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    # Get query parameters
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', 20, type=int)
+    after_id = request.args.get('after_id', type=int)
+    department = request.args.get('department')
+    year_of_study = request.args.get('year_of_study', type=int)
+    
+    # Build a column-level query; rows are turned into dicts without ORM objects
+    stmt = select(
+        Student.id,
+        Student.user_id,
+        Student.student_id,
+        Student.department,
+        Student.year_of_study,
+        Student.enrollment_year,
+        Student.created_at,
+        User.email,
+        User.first_name,
+        User.last_name,
+        User.role,
+        User.phone,
+        User.is_active,
+        User.is_verified,
+        User.created_at.label('user_created_at'),
+        User.updated_at.label('user_updated_at')
+    ).join(User, Student.user_id == User.id)
+    
+    if department:
+        dept_enum = DEPARTMENT_LOOKUP.get(department.upper())
+        if dept_enum is None:
+            return jsonify({'error': 'Invalid department'}), 400
+        stmt = stmt.where(Student.department == dept_enum)
+    
+    if year_of_study:
+        stmt = stmt.where(Student.year_of_study == year_of_study)
+    
+    # Paginate results (same clamping as Flask-SQLAlchemy's paginate)
+    page = max(page, 1)
+    if per_page < 1:
+        per_page = 20
+    
+    # Unfiltered lists use the planner's estimate instead of counting every row
+    total = None if department or year_of_study else estimated_student_count()
+    total_is_estimate = total is not None
+    if total is None:
+        total = db.session.execute(
+            select(func.count()).select_from(stmt.subquery())
+        ).scalar()
+    
+    stmt = stmt.order_by(Student.id).limit(per_page)
+    if after_id is not None:
+        # Keyset pagination: seek past the last id seen instead of scanning an OFFSET
+        stmt = stmt.where(Student.id > after_id)
+    else:
+        stmt = stmt.offset((page - 1) * per_page)
+    rows = db.session.execute(stmt).all()
+    
+    return jsonify({
+        'students': [student_row_to_dict(row) for row in rows],
+        'total': total,
+        'total_is_estimate': total_is_estimate,
+        'pages': math.ceil(total / per_page),
+        'current_page': page if after_id is None else None,
+        'per_page': per_page,
+        'next_after': rows[-1].id if len(rows) == per_page else None
+    }), 200
@@ -1,13 +1,23 @@
 from app import create_app, db
 from models import *
+import signal
+import sys
 
 app = create_app()
 
+def shutdown(signum, frame):
+    """Close pooled database connections before exiting"""
+    with app.app_context():
+        db.engine.dispose()
+    sys.exit(0)
+
 if __name__ == '__main__':
     with app.app_context():
         # Create all database tables
         db.create_all()
         print("Database tables created successfully!")
     
+    signal.signal(signal.SIGTERM, shutdown)
+    
     # Run the application
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
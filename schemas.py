@@ -0,0 +1,56 @@
+from marshmallow import Schema, fields, validate, ValidationError, EXCLUDE
+from models import Department
+
+# Upper-cased department value -> enum member, for request parameter lookups
+DEPARTMENT_LOOKUP = {department.value.upper(): department for department in Department}
+
+class DepartmentField(fields.Field):
+    """Case-insensitive department name deserialized to a Department member"""
+    def _deserialize(self, value, attr, data, **kwargs):
+        department = DEPARTMENT_LOOKUP.get(value.upper()) if isinstance(value, str) else None
+        if department is None:
+            raise ValidationError('Invalid department')
+        return department
+
+PASSWORDS_REQUIRED = 'Current password and new password are required'
+
+class ChangePasswordSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    current_password = fields.String(
+        required=True,
+        validate=validate.Length(min=1, error=PASSWORDS_REQUIRED),
+        error_messages={'required': PASSWORDS_REQUIRED, 'null': PASSWORDS_REQUIRED}
+    )
+    new_password = fields.String(
+        required=True,
+        validate=validate.Length(min=6, error='New password must be at least 6 characters long'),
+        error_messages={'required': PASSWORDS_REQUIRED, 'null': PASSWORDS_REQUIRED}
+    )
+
+class StudentProfileUpdateSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    department = DepartmentField()
+    year_of_study = fields.Integer()
+
+class UpdateProfileSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    first_name = fields.String()
+    last_name = fields.String()
+    phone = fields.String(allow_none=True)
+    student_profile = fields.Nested(StudentProfileUpdateSchema, load_default=dict)
+
+change_password_schema = ChangePasswordSchema()
+update_profile_schema = UpdateProfileSchema()
+
+def first_error(err):
+    """Flatten a ValidationError to the single message the API returns"""
+    messages = err.messages
+    while isinstance(messages, (dict, list)):
+        messages = next(iter(messages.values())) if isinstance(messages, dict) else messages[0]
+    return messages